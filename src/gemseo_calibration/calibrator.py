@@ -24,9 +24,11 @@ from gemseo.algos.design_space import DesignSpace
 from gemseo.algos.doe.custom_doe.custom_doe import CustomDOE
 from gemseo.core.discipline.discipline import Discipline
 from gemseo.core.grammars.json_grammar import JSONGrammar
+from gemseo.datasets.dataset import Dataset
 from gemseo.disciplines.scenario_adapters.mdo_scenario_adapter import MDOScenarioAdapter
 from gemseo.scenarios.doe_scenario import DOEScenario
 from numpy import array
+from numpy import dtype
 from numpy import hstack
 
 from gemseo_calibration.metrics.factory import CalibrationMetricFactory
@@ -61,6 +63,7 @@ class Calibrator(MDOScenarioAdapter):
         | Sequence[CalibrationMetricSettings],
         parameter_names: str | Iterable[str],
         formulation_settings_model: BaseFormulationSettings | None = None,
+        n_processes: int = 1,
         **formulation_settings: Any,
     ) -> None:
         """
@@ -85,6 +88,8 @@ class Calibrator(MDOScenarioAdapter):
             formulation_settings_model: The MDO formulation settings
                 as a Pydantic model.
                 If ``None``, use ``**settings``.
+            n_processes: The maximum number of processes
+                to evaluate the disciplines over the reference input samples.
             **formulation_settings: The MDO formulation settings,
                 including the formulation name (use the keyword ``"formulation_name"``).
                 These arguments are ignored when ``settings_model`` is not ``None``.
@@ -92,6 +97,7 @@ class Calibrator(MDOScenarioAdapter):
                 the calibrator uses the default MDF formulation.
         """  # noqa: D205,D212,D415,E501
         self.__metric_factory = CalibrationMetricFactory()
+        self.__n_processes = n_processes
         input_names = self.__to_iterable(input_names, str)
         metric_settings_models = self.__to_iterable(
             metric_settings_models, CalibrationMetricSettings
@@ -159,12 +165,18 @@ class Calibrator(MDOScenarioAdapter):
         output_grammar.update_from_names(self.__names_to_metrics.keys())
         self.output_grammar = output_grammar
 
-    def set_reference_data(self, reference_data: DataType) -> None:
+    def set_reference_data(self, reference_data: DataType | Dataset) -> None:
         """Pass the reference data to the scenario and to the metrics.
 
+        A [Dataset][gemseo.datasets.dataset.Dataset] is converted once
+        into a dictionary of arrays.
+
         Args:
             reference_data: The reference data with which to compare the discipline.
         """
+        if isinstance(reference_data, Dataset):
+            reference_data = reference_data.to_dict_of_arrays(False)
+
         self.__reference_data = reference_data
         design_space = self.scenario.design_space
         for name in tuple(design_space):
@@ -177,6 +189,7 @@ class Calibrator(MDOScenarioAdapter):
                 reference_data[name]
                 for name in self.scenario.get_optim_variable_names()
             ]),
+            n_processes=self.__n_processes,
         )
         for metric in self.__metrics:
             metric.set_reference_data(self.__reference_data)
@@ -351,6 +364,7 @@ class Calibrator(MDOScenarioAdapter):
                 metric_name=metric_setting.metric_name,
                 mesh_name=metric_setting.mesh_name,
                 weight=missing_weight,
+                dtype=metric_setting.dtype,
             )
 
         return metric_settings_models
@@ -366,22 +380,21 @@ class Calibrator(MDOScenarioAdapter):
         Returns:
             The calibration metric and the associated output name.
         """
+        output_names = [metric_settings_model.output_name]
+        settings = {"output_name": metric_settings_model.output_name}
         if metric_settings_model.mesh_name:
-            metric = self.__metric_factory.create(
-                metric_settings_model.metric_name,
-                output_name=metric_settings_model.output_name,
-                mesh_name=metric_settings_model.mesh_name,
-            )
-            return metric, [
-                metric_settings_model.output_name,
-                metric_settings_model.mesh_name,
-            ]
+            output_names.append(metric_settings_model.mesh_name)
+            settings["mesh_name"] = metric_settings_model.mesh_name
+
+        # The default data type is not passed
+        # to support the metrics whose constructor has no dtype argument.
+        if metric_settings_model.dtype != "float64":
+            settings["dtype"] = dtype(metric_settings_model.dtype)
 
         metric = self.__metric_factory.create(
-            metric_settings_model.metric_name,
-            output_name=metric_settings_model.output_name,
+            metric_settings_model.metric_name, **settings
         )
-        return metric, [metric_settings_model.output_name]
+        return metric, output_names
 
     @property
     def reference_data(self) -> DataType:
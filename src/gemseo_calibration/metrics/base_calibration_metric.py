@@ -16,10 +16,16 @@
 
 from __future__ import annotations
 
+from typing import TYPE_CHECKING
 from typing import ClassVar
 
 from gemseo.core.mdo_functions.mdo_function import MDOFunction
 from gemseo.typing import RealArray
+from numpy import ascontiguousarray
+from numpy import float64
+
+if TYPE_CHECKING:
+    from numpy.typing import DTypeLike
 
 DataType = dict[str, RealArray]
 """The type of data.
@@ -36,6 +42,9 @@ class BaseCalibrationMetric(MDOFunction):
     output_name: str
     """The name of the output used by the metric for calibration."""
 
+    dtype: DTypeLike
+    """The data type used to compare the model and reference output data."""
+
     maximize: ClassVar[bool] = False
     """Whether to maximize the calibration metric."""
 
@@ -44,12 +53,17 @@ class BaseCalibrationMetric(MDOFunction):
         output_name: str,
         name: str = "",
         f_type: MDOFunction.FunctionType = MDOFunction.FunctionType.NONE,
+        dtype: DTypeLike = float64,
     ) -> None:
         """
         Args:
             output_name: The name of the output to be taken into account by the metric.
+            dtype: The data type used to compare the model and reference output data,
+                e.g. `float32` to halve the memory traffic
+                when the precision of `float64` is not required.
         """  # noqa: D205,D212,D415
         self.output_name = output_name
+        self.dtype = dtype
         super().__init__(
             self._evaluate_metric, name or self._compute_name(), f_type=f_type
         )
@@ -67,10 +81,15 @@ class BaseCalibrationMetric(MDOFunction):
     def set_reference_data(self, reference_dataset: DataType) -> None:
         """Define the reference input-output data set.
 
+        The reference output data are stored as a C-contiguous array of type `dtype`
+        since they are read at each evaluation of the metric.
+
         Args:
             reference_dataset: The reference input-output data set.
         """
-        self._reference_data = reference_dataset[self.output_name]
+        self._reference_data = ascontiguousarray(
+            reference_dataset[self.output_name], dtype=self.dtype
+        )
 
     def _evaluate_metric(self, model_dataset: DataType) -> float:
         """Evaluate the metric given a model dataset.
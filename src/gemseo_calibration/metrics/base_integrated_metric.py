@@ -16,16 +16,37 @@
 
 from __future__ import annotations
 
-from numpy import interp
-from numpy import mean
-from numpy import trapz as integrate
+from typing import TYPE_CHECKING
+
+from numpy import arange
+from numpy import array_equal
+from numpy import ascontiguousarray
+from numpy import diff
+from numpy import divide
+from numpy import empty
+from numpy import float64
+from numpy import newaxis
+from numpy import searchsorted
+from numpy import zeros
 
 from gemseo_calibration.metrics.base_calibration_metric import BaseCalibrationMetric
 from gemseo_calibration.metrics.base_calibration_metric import DataType
 
+if TYPE_CHECKING:
+    from gemseo.typing import RealArray
+    from numpy.typing import DTypeLike
+
 
 class BaseIntegratedMetric(BaseCalibrationMetric):
-    """The base class for integrated metrics."""
+    """The base class for integrated metrics.
+
+    The model data are linearly interpolated over the reference mesh
+    with weights depending only on the reference and model meshes;
+    these weights are reused as long as the model mesh does not change.
+
+    The integral over the reference mesh is computed with the trapezoidal rule
+    whose weights are computed once when setting the reference data.
+    """
 
     mesh_name: str
     """The name of the 1D mesh."""
@@ -36,6 +57,7 @@ class BaseIntegratedMetric(BaseCalibrationMetric):
         mesh_name: str,
         name: str = "",
         f_type: BaseCalibrationMetric.FunctionType = BaseCalibrationMetric.FunctionType.NONE,  # noqa: E501
+        dtype: DTypeLike = float64,
     ) -> None:
         """
         Args:
@@ -43,29 +65,119 @@ class BaseIntegratedMetric(BaseCalibrationMetric):
         """  # noqa: D205 D212 D415
         self.mesh_name = mesh_name
         self.__reference_mesh = None
-        super().__init__(output_name, name=name, f_type=f_type)
+        self.__integration_weights = None
+        self.__interpolation_indices = None
+        self.__interpolation_weights = None
+        self.__model_mesh = None
+        self.__is_reference_mesh = False
+        super().__init__(output_name, name=name, f_type=f_type, dtype=dtype)
 
     def _compute_name(self) -> str:
         return f"{self.__class__.__name__}({self.output_name};{self.mesh_name})"
 
     def _evaluate_metric(self, model_dataset: DataType) -> float:  # noqa: D102
-        model_data = model_dataset[self.output_name]
-        model_mesh = model_dataset[self.mesh_name]
-        return mean([
-            integrate(  # noqa: NPY201
-                self._compare_data(
-                    self._reference_data[i],
-                    interp(self.__reference_mesh[i], model_mesh[i], model_data[i]),
-                ),
-                self.__reference_mesh[i],
+        model_mesh, model_data = self.__sort(
+            model_dataset[self.mesh_name],
+            model_dataset[self.output_name].astype(self.dtype, copy=False),
+        )
+        if self.__model_mesh is None or not array_equal(model_mesh, self.__model_mesh):
+            self.__compute_interpolation_weights(model_mesh)
+
+        if self.__is_reference_mesh:
+            interpolated_model_data = model_data
+        else:
+            rows = arange(len(model_data))[:, newaxis]
+            lower_indices, upper_indices = self.__interpolation_indices
+            weights = self.__interpolation_weights
+            interpolated_model_data = (
+                model_data[rows, lower_indices] * (1 - weights)
+                + model_data[rows, upper_indices] * weights
             )
-            for i in range(len(model_data))
-        ])
+
+        comparison = self._compare_data(self._reference_data, interpolated_model_data)
+        return (comparison * self.__integration_weights).sum(axis=1).mean()
+
+    def __compute_interpolation_weights(self, model_mesh: RealArray) -> None:
+        """Compute the weights to interpolate the model data over the reference mesh.
+
+        Outside the model mesh,
+        the model data are extrapolated by the nearest value
+        and at equal nodes,
+        the model data are taken at the last one,
+        as with [numpy.interp][numpy.interp].
+        When the model mesh is the reference mesh,
+        the interpolation will be skipped.
+
+        Args:
+            model_mesh: The ascending model mesh.
+        """
+        indices = empty(self.__reference_mesh.shape, dtype=int)
+        for i, (mesh, reference_mesh) in enumerate(
+            zip(model_mesh, self.__reference_mesh)
+        ):
+            indices[i] = searchsorted(mesh, reference_mesh, side="right") - 1
+
+        n_nodes = model_mesh.shape[1]
+        lower_indices = indices.clip(0, max(n_nodes - 2, 0))
+        upper_indices = (lower_indices + 1).clip(max=n_nodes - 1)
+        rows = arange(len(model_mesh))[:, newaxis]
+        lower_nodes = model_mesh[rows, lower_indices]
+        upper_nodes = model_mesh[rows, upper_indices]
+        weights = divide(
+            self.__reference_mesh - lower_nodes,
+            upper_nodes - lower_nodes,
+            out=(self.__reference_mesh >= upper_nodes).astype(float64),
+            where=upper_nodes > lower_nodes,
+        )
+        self.__interpolation_indices = (lower_indices, upper_indices)
+        self.__interpolation_weights = weights.clip(0.0, 1.0).astype(self.dtype)
+        self.__model_mesh = model_mesh.copy()
+        self.__is_reference_mesh = array_equal(model_mesh, self.__reference_mesh)
+
+    @staticmethod
+    def __sort(mesh: RealArray, data: RealArray) -> tuple[RealArray, RealArray]:
+        """Sort the meshes in ascending order.
+
+        Args:
+            mesh: The meshes, either ascending or descending,
+                shaped as ``(n_observations, n_nodes)``.
+            data: The data over the meshes,
+                shaped as ``(n_observations, n_nodes)``.
+
+        Returns:
+            The ascending meshes and the corresponding data.
+        """
+        is_descending = mesh[:, 0] > mesh[:, -1]
+        if is_descending.any():
+            mesh = mesh.copy()
+            data = data.copy()
+            mesh[is_descending] = mesh[is_descending, ::-1]
+            data[is_descending] = data[is_descending, ::-1]
+
+        return mesh, data
 
     @property
     def full_output_name(self) -> str:  # noqa: D102
         return f"{self.output_name}[{self.mesh_name}]"
 
-    def set_reference_data(self, reference_dataset: DataType) -> None:  # noqa: D102
-        self.__reference_mesh = reference_dataset[self.mesh_name]
+    def set_reference_data(self, reference_dataset: DataType) -> None:
+        """Define the reference input-output data set.
+
+        The reference meshes are stored in ascending order,
+        so that the orientation of the meshes is checked once
+        rather than at each evaluation of the metric.
+
+        Args:
+            reference_dataset: The reference input-output data set.
+        """
         super().set_reference_data(reference_dataset)
+        reference_mesh, reference_data = self.__sort(
+            reference_dataset[self.mesh_name], self._reference_data
+        )
+        self.__reference_mesh = ascontiguousarray(reference_mesh)
+        self._reference_data = reference_data
+        half_steps = diff(reference_mesh, axis=1) / 2
+        self.__integration_weights = zeros(reference_mesh.shape, dtype=self.dtype)
+        self.__integration_weights[:, :-1] += half_steps
+        self.__integration_weights[:, 1:] += half_steps
+        self.__model_mesh = None
@@ -16,15 +16,19 @@
 
 from __future__ import annotations
 
-from numpy import nanmean
+from numpy import isnan
 
 from gemseo_calibration.metrics.base_calibration_metric import BaseCalibrationMetric
 from gemseo_calibration.metrics.base_calibration_metric import DataType
 
 
 class BaseMeanMetric(BaseCalibrationMetric):
-    """The base class for mean metrics between the model and reference output data."""
+    """The base class for mean metrics between the model and reference output data.
+
+    The missing values of the model and reference output data are ignored.
+    """
 
     def _evaluate_metric(self, model_dataset: DataType) -> float:  # noqa: D102
-        model_data = model_dataset[self.output_name]
-        return nanmean(self._compare_data(self._reference_data, model_data))
+        model_data = model_dataset[self.output_name].astype(self.dtype, copy=False)
+        comparison = self._compare_data(self._reference_data, model_data)
+        return comparison.mean(where=~isnan(comparison))
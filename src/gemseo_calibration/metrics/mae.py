@@ -18,6 +18,9 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
+from numpy import absolute
+from numpy import ndarray
+
 from gemseo_calibration.metrics.base_mean_metric import BaseMeanMetric
 
 if TYPE_CHECKING:
@@ -29,4 +32,7 @@ class MAE(BaseMeanMetric):
 
     @staticmethod
     def _compare_data(data: RealArray, other_data: RealArray) -> RealArray:
-        return abs(data - other_data)
+        difference = data - other_data
+        return absolute(
+            difference, out=difference if isinstance(difference, ndarray) else None
+        )
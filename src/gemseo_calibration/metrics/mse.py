@@ -18,6 +18,9 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
+from numpy import ndarray
+from numpy import square
+
 from gemseo_calibration.metrics.base_mean_metric import BaseMeanMetric
 
 if TYPE_CHECKING:
@@ -29,4 +32,7 @@ class MSE(BaseMeanMetric):
 
     @staticmethod
     def _compare_data(data: RealArray, other_data: RealArray) -> RealArray:
-        return (data - other_data) ** 2
+        difference = data - other_data
+        return square(
+            difference, out=difference if isinstance(difference, ndarray) else None
+        )
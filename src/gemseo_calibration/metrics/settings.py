@@ -16,6 +16,8 @@
 
 from __future__ import annotations
 
+from typing import Literal
+
 from pydantic import BaseModel
 from pydantic import ConfigDict
 from pydantic import Field
@@ -52,3 +54,12 @@ The sum of the weights of the elements in the collection must be 1.
 In a collection,
 all the calibration metrics with `weight` set to `None` will have the same weight.""",
     )
+
+    dtype: Literal["float32", "float64"] = Field(
+        default="float64",
+        description="""The floating-point data type
+used to compare the model and reference output data.
+
+E.g. `"float32"` to halve the memory traffic
+when the precision of `float64` is not required.""",
+    )
@@ -33,6 +33,7 @@ if TYPE_CHECKING:
     from gemseo.algos.base_driver_settings import BaseDriverSettings
     from gemseo.algos.design_space import DesignSpace
     from gemseo.core.discipline.discipline import Discipline
+    from gemseo.datasets.dataset import Dataset
     from gemseo.formulations.base_formulation_settings import BaseFormulationSettings
     from gemseo.post.base_post import BasePost
     from gemseo.post.base_post_settings import BasePostSettings
@@ -84,6 +85,7 @@ class CalibrationScenario(MDOScenario):
         calibration_space: DesignSpace,
         name: str = "",
         formulation_settings_model: BaseFormulationSettings | None = None,
+        n_processes: int = 1,
         **formulation_settings: Any,
     ) -> None:
         """
@@ -111,6 +113,8 @@ class CalibrationScenario(MDOScenario):
                 If empty, use the name of the class.
             formulation_settings_model: The formulation settings as a Pydantic model.
                 If ``None``, use ``**settings``.
+            n_processes: The maximum number of processes
+                to evaluate the disciplines over the reference input samples.
             **formulation_settings: The formulation settings,
                 including the formulation name (use the keyword ``"formulation_name"``).
                 These arguments are ignored when ``settings_model`` is not ``None``.
@@ -128,6 +132,7 @@ class CalibrationScenario(MDOScenario):
             metric_settings_models,
             calibration_space.variable_names,
             formulation_settings_model=formulation_settings_model,
+            n_processes=n_processes,
             **formulation_settings,
         )
         super().__init__(
@@ -142,7 +147,7 @@ class CalibrationScenario(MDOScenario):
 
     def set_algorithm(  # noqa:D102
         self,
-        reference_data: StrKeyMapping,
+        reference_data: StrKeyMapping | Dataset,
         algo_settings_model: BaseDriverSettings | None = None,
         **algo_settings: Any,
     ) -> None:
@@ -14,9 +14,14 @@
 # Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301, USA.
 from __future__ import annotations
 
+from contextlib import contextmanager
 from pathlib import Path
+from typing import TYPE_CHECKING
+from typing import Callable
 
 import pytest
+from gemseo.algos.parameter_space import ParameterSpace
+from gemseo.core.base_factory import BaseFactory
 from gemseo.disciplines.analytic import AnalyticDiscipline
 from gemseo.utils.testing.pytest_conftest import *  # noqa: F401, F403
 from matplotlib import pyplot as plt
@@ -26,6 +31,10 @@ from numpy import ndarray
 from gemseo_calibration.metrics.factory import CalibrationMetricFactory
 from gemseo_calibration.post.factory import CalibrationPostFactory
 
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from contextlib import AbstractContextManager
+
 DATA = Path(__file__).parent / "data"
 
 
@@ -45,6 +54,18 @@ def reference_data() -> dict[str, ndarray]:
     }
 
 
+@pytest.fixture(scope="package")
+def prior_space() -> ParameterSpace:
+    """The prior space of the parameters a and b.
+
+    It must be copied before being used by a calibration scenario.
+    """
+    space = ParameterSpace()
+    space.add_variable("a", lower_bound=0.0, upper_bound=10.0, value=0.0)
+    space.add_variable("b", lower_bound=0.0, upper_bound=10.0, value=0.0)
+    return space
+
+
 @pytest.fixture
 def baseline_images(request):
     """Return the baseline_images contents.
@@ -60,14 +81,40 @@ def pyplot_close_all():
     plt.close("all")
 
 
+@pytest.fixture(scope="package")
+def use_test_data() -> Callable[[], AbstractContextManager[None]]:
+    """A context manager in which the factories find the classes of the test data.
+
+    The factories created in this context keep these classes after leaving it.
+    """
+
+    @contextmanager
+    def context() -> Iterator[None]:
+        """Point GEMSEO_PATH to the test data and clear the cache of the factories.
+
+        Yields:
+            Nothing.
+        """
+        with pytest.MonkeyPatch.context() as monkeypatch:
+            monkeypatch.setenv("GEMSEO_PATH", DATA)
+            BaseFactory.clear_cache()
+            try:
+                yield
+            finally:
+                BaseFactory.clear_cache()
+
+    return context
+
+
 @pytest.fixture
-def metric_factory(reset_factory, monkeypatch) -> CalibrationMetricFactory:
-    monkeypatch.setenv("GEMSEO_PATH", DATA)
-    return CalibrationMetricFactory()
+def metric_factory(use_test_data) -> Iterator[CalibrationMetricFactory]:
+    """The factory of calibration metrics, including the ones of the test data."""
+    with use_test_data():
+        yield CalibrationMetricFactory()
 
 
 @pytest.fixture
-def post_factory(reset_factory, monkeypatch) -> CalibrationPostFactory:
+def post_factory(use_test_data) -> Iterator[CalibrationPostFactory]:
     """The factory of post-processors dedicated to calibration."""
-    monkeypatch.setenv("GEMSEO_PATH", DATA)
-    return CalibrationPostFactory()
+    with use_test_data():
+        yield CalibrationPostFactory()
@@ -54,3 +54,16 @@ class NewCalibrationMetric(BaseCalibrationMetric):
         model_dataset: dict[str, ndarray],
     ) -> float:
         return 0.0
+
+
+class MetricWithoutDtype(BaseCalibrationMetric):
+    """The calibration metric returning zero whose constructor has no dtype."""
+
+    def __init__(self, output_name: str) -> None:  # noqa: D107
+        super().__init__(output_name)
+
+    def _evaluate_metric(  # noqa: D102
+        self,
+        model_dataset: dict[str, ndarray],
+    ) -> float:
+        return 0.0
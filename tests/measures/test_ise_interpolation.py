@@ -0,0 +1,89 @@
+# Copyright 2021 IRT Saint Exupéry, https://www.irt-saintexupery.com
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License version 3 as published by the Free Software Foundation.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with this program; if not, write to the Free Software Foundation,
+# Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301, USA.
+"""Test the interpolation of the model data by the calibration metric ISE."""
+
+from __future__ import annotations
+
+import pytest
+from gemseo.datasets.dataset import Dataset
+from numpy import array
+from numpy import linspace
+
+from gemseo_calibration.metrics.iae import IAE
+from gemseo_calibration.metrics.ise import ISE
+
+
+def create_dataset(
+    mesh_size: int, is_decreasing_mesh: bool, offset: float = 0.0
+) -> Dataset:
+    """Create a dataset with an output ``y = mesh + offset`` over a 1D mesh.
+
+    Args:
+        mesh_size: The number of nodes of the mesh over [0, 1].
+        is_decreasing_mesh: Whether the mesh is decreasing.
+        offset: The offset of the output.
+
+    Returns:
+        The dataset.
+    """
+    bounds = (1.0, 0.0) if is_decreasing_mesh else (0.0, 1.0)
+    mesh = linspace(*bounds, mesh_size)
+
+    dataset = Dataset()
+    dataset.add_variable("y", mesh[None, :] + offset)
+    dataset.add_variable("mesh", mesh[None, :])
+    return dataset
+
+
+@pytest.mark.parametrize("is_decreasing_reference_mesh", [False, True])
+@pytest.mark.parametrize("is_decreasing_model_mesh", [False, True])
+def test_interpolation(is_decreasing_reference_mesh, is_decreasing_model_mesh):
+    """Check that ISE does not depend on the orientations of the meshes."""
+    reference_dataset = create_dataset(5, is_decreasing_reference_mesh)
+    model_dataset = create_dataset(11, is_decreasing_model_mesh, offset=2.0)
+    metric = ISE("y", "mesh")
+    metric.set_reference_data(reference_dataset.to_dict_of_arrays(False))
+    assert metric.func(model_dataset.to_dict_of_arrays(False)) == pytest.approx(4.0)
+
+
+def test_interpolation_with_new_model_mesh():
+    """Check that the interpolation weights are updated when the model mesh changes."""
+    metric = ISE("y", "mesh")
+    metric.set_reference_data(create_dataset(5, False).to_dict_of_arrays(False))
+    for mesh_size, offset in [(11, 2.0), (11, 1.0), (3, 2.0), (3, 2.0)]:
+        model_dataset = create_dataset(mesh_size, False, offset=offset)
+        assert metric.func(model_dataset.to_dict_of_arrays(False)) == pytest.approx(
+            offset**2
+        )
+
+
+@pytest.mark.parametrize(
+    ("model_mesh", "model_data", "expected"),
+    [
+        pytest.param([0.0, 1.0, 1.0], [1.0, 2.0, 3.0], 1.25, id="repeated-last-node"),
+        pytest.param([0.0, 0.0, 1.0], [1.0, 2.0, 3.0], 2.0, id="repeated-first-node"),
+        pytest.param([0.5], [2.0], 1.5, id="single-node"),
+    ],
+)
+def test_interpolation_with_degenerate_model_mesh(model_mesh, model_data, expected):
+    """Check the interpolation over model meshes with equal nodes or a single node.
+
+    The expected values are computed with numpy.interp.
+    """
+    reference_mesh = array([[0.0, 0.5, 1.0]])
+    metric = IAE("y", "mesh")
+    metric.set_reference_data({"y": reference_mesh, "mesh": reference_mesh})
+    model_dataset = {"y": array([model_data]), "mesh": array([model_mesh])}
+    assert metric.func(model_dataset) == pytest.approx(expected)
@@ -16,9 +16,11 @@
 
 from __future__ import annotations
 
+import pytest
 from numpy import array
 from numpy.testing import assert_array_equal
 
+from gemseo_calibration.metrics.iae import IAE
 from gemseo_calibration.metrics.mae import MAE
 
 
@@ -26,3 +28,9 @@ def test_compute_output_error():
     """Test that the static method _compute_output_error returns an absolute error."""
     output_error = MAE._compare_data(array([0.0]), array([2.0]))
     assert_array_equal(output_error, array([2.0]))
+
+
+@pytest.mark.parametrize("metric", [MAE, IAE])
+def test_compute_output_error_with_scalars(metric):
+    """Test that the static method _compute_output_error supports scalars."""
+    assert metric._compare_data(0.0, 2.0) == 2.0
@@ -18,6 +18,7 @@ from __future__ import annotations
 
 import pytest
 from numpy import array
+from numpy import float32
 from numpy import nan
 from numpy import ndarray
 from numpy import ones
@@ -88,3 +89,24 @@ def test_mean_error_with_interpolation_over_reference_mesh(
     metric = IAE("y", "m")
     metric.set_reference_data(reference_data)
     assert metric.func(model_data) == expected_metric
+
+
+def test_mean_error_with_float32(reference_data, model_data):
+    """Test that the mean error can be computed in single precision."""
+    mae = MAE("z", dtype=float32)
+    mae.set_reference_data(reference_data)
+    assert mae._reference_data.dtype == float32
+    result = mae.func(model_data)
+    assert result.dtype == float32
+    assert result == pytest.approx(2.2)
+
+
+def test_integrated_error_with_float32():
+    """Test that the integrated error can be computed in single precision."""
+    reference_data = {"y": ones((1, 4)), "m": array([[0.0, 1.0, 2.0, 3.0]])}
+    model_data = {"y": array([[2.0, 3.0, 4.0]]), "m": array([[0.0, 1.0, 3.0]])}
+    metric = IAE("y", "m", dtype=float32)
+    metric.set_reference_data(reference_data)
+    result = metric.func(model_data)
+    assert result.dtype == float32
+    assert result == pytest.approx(6.5)
@@ -29,3 +29,9 @@ def test_compute_output_error(metric):
     """Test that the static method _compute_output_error returns a squared error."""
     output_error = metric._compare_data(array([0.0]), array([2.0]))
     assert_array_equal(output_error, array([4.0]))
+
+
+@pytest.mark.parametrize("metric", [MSE, ISE])
+def test_compute_output_error_with_scalars(metric):
+    """Test that the static method _compute_output_error supports scalars."""
+    assert metric._compare_data(0.0, 2.0) == 4.0
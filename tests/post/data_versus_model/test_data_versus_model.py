@@ -21,26 +21,59 @@
 
 from __future__ import annotations
 
+from copy import deepcopy
+
 import pytest
-from gemseo.algos.parameter_space import ParameterSpace
-from gemseo.disciplines.analytic import AnalyticDiscipline
+from gemseo.disciplines.auto_py import AutoPyDiscipline
 from gemseo.utils.testing.helpers import image_comparison
 from numpy import array
+from numpy import ndarray
 
 from gemseo_calibration.metrics.settings import CalibrationMetricSettings
 from gemseo_calibration.post.data_versus_model.post import DataVersusModel
 from gemseo_calibration.scenario import CalibrationScenario
 
+ZERO = array([0.0])
+"""The default value of the inputs of the models."""
+
+
+def model(
+    x: ndarray = ZERO, a: ndarray = ZERO, b: ndarray = ZERO
+) -> tuple[ndarray, ndarray]:
+    """The model y=a*x and z=b*x to be calibrated.
+
+    Args:
+        x: The input.
+        a: The first parameter.
+        b: The second parameter.
+
+    Returns:
+        The outputs y and z.
+    """
+    y = a * x
+    z = b * x
+    return y, z
+
+
+def reference_model(x: ndarray = ZERO) -> tuple[ndarray, ndarray]:
+    """The model y=2*x and z=3*x to be approximated.
+
+    Args:
+        x: The input.
+
+    Returns:
+        The outputs y and z.
+    """
+    y = 2 * x
+    z = 3 * x
+    return y, z
+
 
 @pytest.fixture(scope="module")
-def calibration_scenario() -> CalibrationScenario:
+def calibration_scenario(prior_space) -> CalibrationScenario:
     """A calibration scenario."""
-    model = AnalyticDiscipline({"y": "a*x", "z": "b*x"}, name="model")
-    reference = AnalyticDiscipline({"y": "2*x", "z": "3*x"}, name="reference")
-
-    prior = ParameterSpace()
-    prior.add_variable("a", lower_bound=0.0, upper_bound=10.0, value=0.0)
-    prior.add_variable("b", lower_bound=0.0, upper_bound=10.0, value=0.0)
+    reference = AutoPyDiscipline(reference_model)
+    prior = deepcopy(prior_space)
 
     reference.set_cache("MemoryFullCache")
     reference.execute({"x": array([1.0])})
@@ -48,7 +81,7 @@ def calibration_scenario() -> CalibrationScenario:
     reference_data = reference.cache.to_dataset().to_dict_of_arrays(False)
 
     calibration = CalibrationScenario(
-        model,
+        AutoPyDiscipline(model),
         "x",
         [
             CalibrationMetricSettings(output_name="y", metric_name="MSE"),
@@ -17,6 +17,7 @@
 from __future__ import annotations
 
 import pytest
+from gemseo.datasets.dataset import Dataset
 from numpy import array
 from numpy.testing import assert_equal
 
@@ -89,6 +90,50 @@ def test_set_reference_data(adapter, reference_data):
     assert_equal(adapter.reference_data, reference_data)
 
 
+def test_n_processes(metric_factory, discipline, reference_data):
+    """Check that the metrics do not depend on the number of processes."""
+    metrics = []
+    for n_processes in [1, 2]:
+        adapter = Calibrator(
+            discipline,
+            ["x"],
+            CalibrationMetricSettings(output_name="y", metric_name="MetricObj"),
+            ["a", "b"],
+            n_processes=n_processes,
+        )
+        adapter.add_metric([
+            CalibrationMetricSettings(output_name="y", metric_name="MetricCstr"),
+            CalibrationMetricSettings(output_name="z", metric_name="MetricCstr"),
+        ])
+        adapter.set_reference_data(reference_data)
+        adapter.execute({"a": array([0.25]), "b": array([0.75])})
+        metrics.append({
+            name: adapter.io.data[name] for name in ["MetricObj[y]", CSTR_NAME]
+        })
+
+    assert_equal(metrics[1], metrics[0])
+
+
+@pytest.mark.parametrize(
+    "y_data",
+    [
+        pytest.param(array([[1.0], [2.0]]), id="1-column"),
+        pytest.param(array([[1.0, 3.0], [2.0, 4.0]]), id="2-columns"),
+    ],
+)
+def test_set_reference_dataset(adapter, reference_data, y_data):
+    """Check that a reference dataset is converted once to a dictionary of arrays."""
+    reference_data = {**reference_data, "y": y_data}
+    dataset = Dataset()
+    for name, value in reference_data.items():
+        dataset.add_variable(name, value)
+
+    adapter.set_reference_data(dataset)
+    assert_equal(adapter.reference_data, reference_data)
+    for metric in adapter._Calibrator__metrics:
+        assert_equal(metric._reference_data, reference_data[metric.output_name])
+
+
 def test_execute_default(adapter, reference_data):
     """Check the execution of the Calibrator with default input data."""
     adapter.set_reference_data(reference_data)
@@ -106,3 +151,16 @@ def test_execute(adapter, reference_data):
     adapter.execute({"a": array([0.75])})
     assert adapter.io.data["MetricObj[y]"][0] == 0.375
     assert adapter.io.data[CSTR_NAME][0] == 0.75
+
+
+def test_metric_without_dtype(metric_factory, discipline, reference_data):
+    """Check that a metric whose constructor has no dtype argument can be used."""
+    adapter = Calibrator(
+        discipline,
+        ["x"],
+        CalibrationMetricSettings(output_name="y", metric_name="MetricWithoutDtype"),
+        ["a", "b"],
+    )
+    adapter.set_reference_data(reference_data)
+    adapter.execute({"a": array([0.5]), "b": array([0.5])})
+    assert adapter.io.data["MetricWithoutDtype[y]"][0] == 0.0
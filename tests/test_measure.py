@@ -20,11 +20,17 @@ from typing import TYPE_CHECKING
 
 import pytest
 from numpy import array
+from numpy.testing import assert_array_equal
 from numpy.testing import assert_equal
 
+from gemseo_calibration.metrics.settings import CalibrationMetricSettings
+
 if TYPE_CHECKING:
     from gemseo_calibration.metrics.base_calibration_metric import BaseCalibrationMetric
 
+REFERENCE_Y = array([[2.0], [4.0]])
+"""The reference data of the output y."""
+
 
 @pytest.fixture
 def metric(metric_factory) -> BaseCalibrationMetric:
@@ -40,9 +46,16 @@ def test_metric_init(metric):
 
 def test_metric_set_reference_data(metric):
     """Test the method set_reference_data of CalibrationMetric."""
-    dataset = {"y": array([[2.0], [4.0]])}
-    metric.set_reference_data(dataset)
-    assert_equal(metric._reference_data, dataset["y"])
+    metric.set_reference_data({"y": REFERENCE_Y})
+    assert_array_equal(metric._reference_data, REFERENCE_Y)
+
+
+def test_metric_set_reference_data_contiguous(metric):
+    """Check that set_reference_data stores the reference data contiguously."""
+    data = array([[1.0, 2.0], [3.0, 4.0]])
+    metric.set_reference_data({"y": data[:, :1]})
+    assert metric._reference_data.flags["C_CONTIGUOUS"]
+    assert_equal(metric._reference_data, array([[1.0], [3.0]]))
 
 
 def test_call(metric):
@@ -73,3 +86,13 @@ def test_factory_is_integrated_metric(metric_factory):
     """Test the method is_integrated_metric()."""
     assert metric_factory.is_integrated_metric("ISE")
     assert not metric_factory.is_integrated_metric("MSE")
+
+
+@pytest.mark.parametrize("dtype", ["float32", "float64"])
+def test_settings_serialization(dtype):
+    """Check that the settings of a calibration metric can be serialized."""
+    settings = CalibrationMetricSettings(output_name="y", dtype=dtype)
+    assert (
+        CalibrationMetricSettings.model_validate_json(settings.model_dump_json())
+        == settings
+    )
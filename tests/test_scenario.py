@@ -16,7 +16,9 @@
 
 from __future__ import annotations
 
+from copy import deepcopy
 from typing import TYPE_CHECKING
+from typing import Callable
 
 import pytest
 from gemseo.algos.design_space import DesignSpace
@@ -29,39 +31,75 @@ from gemseo_calibration.post.data_versus_model.post import DataVersusModel
 from gemseo_calibration.scenario import CalibrationScenario
 
 if TYPE_CHECKING:
+    from contextlib import AbstractContextManager
+
     from gemseo.core.discipline.discipline import Discipline
 
 
-@pytest.fixture(scope="module")
+@pytest.fixture(scope="session")
 def calibration_space() -> DesignSpace:
-    """The space of the parameters to calibrate."""
+    """The space of the parameters to calibrate.
+
+    It must be copied before being used by a calibration scenario.
+    """
     space = DesignSpace()
     space.add_variable("a", lower_bound=0.0, upper_bound=1.0, value=0.5)
     space.add_variable("b", lower_bound=0.0, upper_bound=1.0, value=0.5)
     return space
 
 
-@pytest.fixture
-def calibration_scenario(
-    metric_factory,
+@pytest.fixture(scope="module")
+def scenario_factory(
     discipline: Discipline,
     calibration_space: DesignSpace,
-) -> CalibrationScenario:
-    """The scenario to calibrate the discipline with the reference input data."""
-    scenario = CalibrationScenario(
-        discipline,
-        "x",
-        CalibrationMetricSettings(output_name="y", metric_name="MetricObj"),
-        calibration_space,
-        name="calib",
-    )
-    scenario.add_constraint(
-        [
-            CalibrationMetricSettings(output_name="y", metric_name="MetricCstr"),
-            CalibrationMetricSettings(output_name="z", metric_name="MetricCstr"),
-        ],
-        "ineq",
-        value=0.05,
+    use_test_data: Callable[[], AbstractContextManager[None]],
+) -> Callable[[], CalibrationScenario]:
+    """A factory of scenarios to calibrate the discipline with the reference data."""
+
+    def create() -> CalibrationScenario:
+        """Create a scenario using the calibration metrics of the test data.
+
+        Returns:
+            The scenario.
+        """
+        with use_test_data():
+            scenario = CalibrationScenario(
+                discipline,
+                "x",
+                CalibrationMetricSettings(output_name="y", metric_name="MetricObj"),
+                deepcopy(calibration_space),
+                name="calib",
+            )
+            scenario.add_constraint(
+                [
+                    CalibrationMetricSettings(
+                        output_name="y", metric_name="MetricCstr"
+                    ),
+                    CalibrationMetricSettings(
+                        output_name="z", metric_name="MetricCstr"
+                    ),
+                ],
+                "ineq",
+                value=0.05,
+            )
+
+        return scenario
+
+    return create
+
+
+@pytest.fixture(scope="module")
+def calibration_scenario(scenario_factory) -> CalibrationScenario:
+    """The scenario shared by the tests not executing it."""
+    return scenario_factory()
+
+
+@pytest.fixture(scope="module")
+def executed_scenario(scenario_factory, reference_data) -> CalibrationScenario:
+    """The scenario executed once and shared by the tests reading its results."""
+    scenario = scenario_factory()
+    scenario.execute(
+        algo_name="NLOPT_COBYLA", reference_data=reference_data, max_iter=4
     )
     return scenario
 
@@ -80,10 +118,15 @@ def test_init(calibration_scenario):
     )
 
 
-@pytest.mark.parametrize("list_of_disciplines", [False, True])
-@pytest.mark.parametrize("list_of_inputs", [False, True])
-@pytest.mark.parametrize("list_of_outputs", [False, True])
-@pytest.mark.parametrize("list_of_constraints", [False, True])
+@pytest.mark.parametrize(
+    ("list_of_disciplines", "list_of_inputs", "list_of_outputs", "list_of_constraints"),
+    [
+        pytest.param(False, False, False, False, id="all-scalar"),
+        pytest.param(True, True, True, True, id="all-list"),
+        pytest.param(True, False, True, False, id="mixed-a"),
+        pytest.param(False, True, False, True, id="mixed-b"),
+    ],
+)
 def test_init_list(
     metric_factory,
     discipline,
@@ -100,7 +143,9 @@ def test_init_list(
     outputs = [output] if list_of_outputs else output
     constraint = CalibrationMetricSettings(output_name="z", metric_name="MetricCstr")
     constraints = [constraint] if list_of_constraints else constraint
-    scenario = CalibrationScenario(disciplines, inputs, outputs, calibration_space)
+    scenario = CalibrationScenario(
+        disciplines, inputs, outputs, deepcopy(calibration_space)
+    )
     scenario.add_constraint(constraints)
     assert scenario.calibrator.scenario.design_space.variable_names == ["x"]
     assert scenario.calibrator.scenario.formulation._objective_name == "y"
@@ -109,10 +154,10 @@ def test_init_list(
 def test_calibration_adapter(calibration_scenario):
     """Check the calibrator after initialization + add of the constraint."""
     names_to_metrics = calibration_scenario.calibrator._Calibrator__names_to_metrics
-    assert sorted(names_to_metrics.keys()) == [
+    assert names_to_metrics.keys() == {
         "0.5*MetricCstr[y]+0.5*MetricCstr[z]",
         "MetricObj[y]",
-    ]
+    }
 
 
 def test_constraint(calibration_scenario):
@@ -125,20 +170,14 @@ def test_constraint(calibration_scenario):
     assert str(constraints[0]) == "0.5*MetricCstr[y]+0.5*MetricCstr[z](a, b) <= 0.05"
 
 
-def test_execute(calibration_scenario, reference_data):
+def test_execute(executed_scenario):
     """Test that the reference data are correctly passed during the execution."""
-    calibration_scenario.execute(
-        algo_name="NLOPT_COBYLA", reference_data=reference_data, max_iter=10
-    )
-    assert calibration_scenario.prior_parameters == {
+    assert executed_scenario.prior_parameters == {
         "a": array([0.5]),
         "b": array([0.5]),
     }
-    assert (
-        calibration_scenario.posterior_parameters
-        != calibration_scenario.prior_parameters
-    )
-    assert set(calibration_scenario.posterior_parameters.keys()) == {"a", "b"}
+    assert executed_scenario.posterior_parameters != executed_scenario.prior_parameters
+    assert set(executed_scenario.posterior_parameters.keys()) == {"a", "b"}
 
 
 def test_posts(calibration_scenario):
@@ -148,16 +187,13 @@ def test_posts(calibration_scenario):
     assert "DataVersusModel" in posts
 
 
-def test_post_process(calibration_scenario, reference_data):
+def test_post_process(executed_scenario):
     """Check the post-processing of a calibration scenario."""
-    calibration_scenario.execute(
-        algo_name="NLOPT_COBYLA", reference_data=reference_data, max_iter=2
-    )
-    post = calibration_scenario.post_process(
+    post = executed_scenario.post_process(
         post_name="OptHistoryView", save=False, show=False
     )
     assert isinstance(post, OptHistoryView)
-    post = calibration_scenario.post_process(
+    post = executed_scenario.post_process(
         post_name="DataVersusModel", output="y", save=False, show=False
     )
     assert isinstance(post, DataVersusModel)
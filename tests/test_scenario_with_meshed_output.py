@@ -14,79 +14,65 @@
 # Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301, USA.
 from __future__ import annotations
 
+from copy import deepcopy
 from typing import TYPE_CHECKING
 
 import pytest
-from gemseo.algos.parameter_space import ParameterSpace
-from gemseo.core.discipline.discipline import Discipline
+from gemseo.disciplines.auto_py import AutoPyDiscipline
 from numpy import array
+from numpy import float32
 from numpy import linspace
 from numpy import ndarray
+from numpy import tile
 
 from gemseo_calibration.metrics.settings import CalibrationMetricSettings
 from gemseo_calibration.scenario import CalibrationScenario
 
 if TYPE_CHECKING:
-    from gemseo.typing import StrKeyMapping
+    from gemseo.algos.parameter_space import ParameterSpace
 
+MESH = linspace(0.0, 1.0, 3)
+"""The mesh of the outputs y and z."""
 
-class Model(Discipline):
-    """The model to be calibrated."""
+ZERO = array([0.0])
+"""The default value of the inputs of the model."""
 
-    def __init__(self):  # noqa: D107
-        super().__init__()
-        self.input_grammar.update_from_names(["x", "a", "b"])
-        self.output_grammar.update_from_names(["y", "z", "mesh"])
-        self.default_input_data = {
-            "x": array([0.0]),
-            "a": array([0.0]),
-            "b": array([0.0]),
-        }
 
-    def _run(self, input_data: StrKeyMapping) -> StrKeyMapping | None:
-        x_input = self.io.data["x"]
-        a_parameter = self.io.data["a"]
-        b_parameter = self.io.data["b"]
-        z_mesh = linspace(0, 1, 5)
-        y_output = a_parameter * x_input * z_mesh
-        z_output = b_parameter * x_input[0] * z_mesh
-        self.io.update_output_data({"y": y_output, "z": z_output, "mesh": z_mesh})
+def model(
+    x: ndarray = ZERO, a: ndarray = ZERO, b: ndarray = ZERO
+) -> tuple[ndarray, ndarray, ndarray]:
+    """The model to be calibrated.
 
+    Args:
+        x: The input.
+        a: The first parameter.
+        b: The second parameter.
 
-class ReferenceModel(Discipline):
-    """The model to be approximated."""
+    Returns:
+        The outputs y and z and their mesh.
+    """
+    y = a * x * MESH
+    z = b * x[0] * MESH
+    mesh = MESH
+    return y, z, mesh
 
-    def __init__(self):  # noqa: D107
-        super().__init__()
-        self.input_grammar.update_from_names(["x"])
-        self.output_grammar.update_from_names(["y", "z", "mesh"])
-        self.default_input_data = {"x": array([0.0])}
 
-    def _run(self, input_data: StrKeyMapping) -> StrKeyMapping | None:
-        x_input = self.io.data["x"]
-        z_mesh = linspace(0, 1, 5)
-        y_output = 2 * x_input * z_mesh
-        z_output = 3 * x_input[0] * z_mesh
-        self.io.update_output_data({"y": y_output, "z": z_output, "mesh": z_mesh})
-
-
-@pytest.fixture(scope="module")
-def calibration_space() -> ParameterSpace:
-    """The calibration space."""
-    space = ParameterSpace()
-    space.add_variable("a", lower_bound=0.0, upper_bound=10.0, value=0.0)
-    space.add_variable("b", lower_bound=0.0, upper_bound=10.0, value=0.0)
-    return space
+@pytest.fixture
+def calibration_space(prior_space) -> ParameterSpace:
+    """The calibration space, copied for each test as its execution changes it."""
+    return deepcopy(prior_space)
 
 
 @pytest.fixture(scope="module")
 def reference_data() -> dict[str, ndarray]:
-    """The reference dataset."""
-    reference = ReferenceModel()
-    reference.set_cache("MemoryFullCache")
-    reference.execute({"x": array([1.0])})
-    reference.execute({"x": array([2.0])})
-    return reference.cache.to_dataset().to_dict_of_arrays(False)
+    """The reference dataset computed from y=2*x*mesh and z=3*x*mesh."""
+    x_input = array([[1.0], [2.0]])
+    return {
+        "x": x_input,
+        "y": 2 * x_input * MESH,
+        "z": 3 * x_input * MESH,
+        "mesh": tile(MESH, (2, 1)),
+    }
 
 
 def test_execute(reference_data, calibration_space):
@@ -95,9 +81,15 @@ def test_execute(reference_data, calibration_space):
         CalibrationMetricSettings(output_name="y", metric_name="MSE"),
         CalibrationMetricSettings(output_name="z", mesh_name="mesh", metric_name="ISE"),
     ]
-    calibration = CalibrationScenario(Model(), "x", outputs, calibration_space)
+    calibration = CalibrationScenario(
+        AutoPyDiscipline(model), "x", outputs, calibration_space
+    )
     calibration.execute(
-        algo_name="NLOPT_COBYLA", reference_data=reference_data, max_iter=100
+        algo_name="NLOPT_COBYLA",
+        reference_data=reference_data,
+        max_iter=100,
+        xtol_rel=1e-2,
+        ftol_rel=1e-4,
     )
 
     assert calibration.posterior_parameters["a"][0] == pytest.approx(2.0, 0.1)
@@ -106,3 +98,29 @@ def test_execute(reference_data, calibration_space):
         calibration.formulation.optimization_problem.objective.name
         == "0.5*MSE[y]+0.5*ISE[z[mesh]]"
     )
+
+
+def test_execute_with_float32(reference_data, calibration_space):
+    """Check the execution of the calibration scenario with float32 metrics."""
+    outputs = [
+        CalibrationMetricSettings(output_name="y", metric_name="MSE", dtype="float32"),
+        CalibrationMetricSettings(
+            output_name="z", mesh_name="mesh", metric_name="ISE", dtype="float32"
+        ),
+    ]
+    calibration = CalibrationScenario(
+        AutoPyDiscipline(model), "x", outputs, calibration_space
+    )
+    calibration.execute(
+        algo_name="NLOPT_COBYLA",
+        reference_data=reference_data,
+        max_iter=100,
+        xtol_rel=1e-2,
+        ftol_rel=1e-4,
+    )
+
+    metrics = calibration.calibrator._Calibrator__metrics
+    assert [metric.dtype for metric in metrics] == [float32, float32]
+    assert [metric._reference_data.dtype for metric in metrics] == [float32] * 2
+    assert calibration.posterior_parameters["a"][0] == pytest.approx(2.0, 0.1)
+    assert calibration.posterior_parameters["b"][0] == pytest.approx(3.0, 0.1)